@@ -1,64 +1,506 @@
 import os
 import sys
+import shutil
+import contextlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import re
-import tkinter
-from tkinter import filedialog
-from PIL import Image, ImageOps
-from io import BytesIO
-from urllib.parse import quote_plus
+import threading
+import contextvars
+import functools
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import traceback  # <<< ADDED: To print detailed error information
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional: the standard library parser is slower but works the same
+    import json
+    _json_loads = json.loads
+
 # Base URL for APIs
 SCRYFALL_API_BASE_URL = "https://api.scryfall.com"
+SCRYFALL_IMAGE_BASE_URL = "https://cards.scryfall.io"
+
+# Scryfall's API rate limit: at most API_RATE_LIMIT requests every API_RATE_PERIOD seconds
+API_RATE_LIMIT = 10
+API_RATE_PERIOD = 1.0
+
+# How often a rate limited (HTTP 429) API request is retried, and the base delay
+# used when Scryfall does not send a Retry-After header
+MAX_RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF = 0.5
+
+# Most card identifiers Scryfall accepts in one /cards/collection request
+COLLECTION_BATCH_SIZE = 75
+
+# Number of cards downloaded in parallel. Image downloads are I/O bound, so
+# threads overlap the network waits; API calls still go through the rate limiter.
+MAX_WORKERS = 10
+
+# Seconds to wait for Scryfall to respond before giving up on a request
+REQUEST_TIMEOUT = 30
+
+# Bytes copied at a time when an image is streamed straight to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Card images are already compressed, so they are asked for as-is rather than gzipped
+IMAGE_HEADERS = {'Accept-Encoding': 'identity'}
 
-# Delay between API requests in seconds to respect Scryfall's rate limit (100ms)
-REQUEST_DELAY = 0.1
+# Suffix of the temporary file an image is written to before it is moved into place
+PARTIAL_SUFFIX = '.part'
+
+# How long API responses stay in the on-disk cache (only used when requests-cache is installed)
+CACHE_EXPIRE_SECONDS = 86400 * 7
 
 # --- Constants for Physical Dimensions ---
 CARD_WIDTH_INCHES = 2.5
 CARD_HEIGHT_INCHES = 3.5
 BORDER_INCHES = 0.125
 
+# Pixel width Scryfall serves each image size at (art crops vary with the artwork),
+# so the border for those sizes is worked out once instead of for every image
+IMAGE_WIDTHS = {'small': 146, 'normal': 488, 'large': 672, 'png': 745, 'border_crop': 480, 'art_crop': None}
+BORDER_PIXELS = {
+    size: round(width / CARD_WIDTH_INCHES * BORDER_INCHES)
+    for size, width in IMAGE_WIDTHS.items() if width
+}
+
+# --- Scryfall Image Sizes and Card Layouts ---
+STANDARD_SIZES = frozenset({'small', 'normal', 'large', 'png', 'art_crop', 'border_crop'})
+
+# Layouts with one image for the whole card
+SINGLE_IMAGE_LAYOUTS = frozenset({
+    'normal', 'split', 'flip', 'leveler', 'class', 'case', 'saga',
+    'adventure', 'mutate', 'prototype', 'planar', 'scheme', 'vanguard',
+    'token', 'emblem', 'augment', 'host'
+})
+# Layouts with a separate image for each face
+DOUBLE_IMAGE_LAYOUTS = frozenset({
+    'transform', 'modal_dfc', 'double_faced_token', 'art_series', 'reversible_card'
+})
+MELD_COMPONENTS = frozenset({'meld_part', 'meld_result'})
+
+# The card fields process_card reads; set listings keep only these, since they are
+# held in memory for the whole session and most of each card's JSON is rules text,
+# prices and legalities that are never used
+CARD_FIELDS = (
+    'layout', 'name', 'set', 'collector_number', 'flavor_name',
+    'image_uris', 'card_faces', 'all_parts'
+)
+
+# Outcome of a single queued download, tallied for the end-of-run summary
+DOWNLOAD_SAVED = 'saved'
+DOWNLOAD_SKIPPED = 'skipped'
+DOWNLOAD_FAILED = 'failed'
+
+# RGBA fill for each border colour choice
+BORDER_COLORS = {
+    'transparent': (0, 0, 0, 0),
+    'white': (255, 255, 255, 255),
+    'black': (0, 0, 0, 255)
+}
+
+# Deletes the characters that are not allowed in file names on Windows
+_FILENAME_TABLE = str.maketrans('', '', '\\/*?:"<>|')
+# Set code, collector number and, for a printing in another language, the language
+# code from a Scryfall card page URL (/card/<set>/<number>[/<lang>]/<slug>). A short
+# segment only counts as the language when a slug follows it, so /card/sld/1a/elk/ has none.
+_SCRYFALL_URL = re.compile(r'scryfall\.com/card/(?P<set>[^/]+)/(?P<number>[^/?#]+)(?:/(?P<lang>[a-z]{2,3})(?=/[^/?#]))?')
+# Decklist line: quantity, name and an optional "(SET) number" suffix
+_DECK_LINE = re.compile(r"^\s*(\d+)\s+(.+?)(?:\s+\((\w{3,5})\)\s+([\w\d-]+))?\s*$")
+
+def get_script_dir():
+    """Returns the folder of the script, or of the executable when running as a frozen build."""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+def create_session():
+    """Builds the HTTP session shared by every request.
+
+    A single session keeps connections to api.scryfall.com and cards.scryfall.io
+    alive between requests instead of doing a new TLS handshake every time.
+    With requests-cache installed, API responses are also kept in a SQLite file
+    next to the script so repeated runs don't hit the API at all. Images are
+    excluded; they are large and already end up on disk as the output files.
+    """
+    try:
+        import requests_cache
+    except ImportError:  # Optional: without it nothing is cached between runs
+        requests_cache = None
+
+    if requests_cache:
+        session = requests_cache.CachedSession(
+            cache_name=os.path.join(get_script_dir(), '.scryfall_cache'),
+            backend='sqlite',
+            expire_after=CACHE_EXPIRE_SECONDS,
+            urls_expire_after={'cards.scryfall.io': requests_cache.DO_NOT_CACHE}
+        )
+    else:
+        session = requests.Session()
+    # The API and the image CDN each get their own connection pool, sized for how
+    # many requests to that host can be in flight, so a burst of image downloads
+    # never waits on an API connection or the other way round. The pools block when
+    # full, so an extra thread waits for a kept-alive connection instead of opening a
+    # one-off connection (and TLS handshake) that is thrown away afterwards.
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+    session.mount("https://", HTTPAdapter(max_retries=retries))
+    session.mount(SCRYFALL_API_BASE_URL, HTTPAdapter(
+        pool_connections=1, pool_maxsize=API_RATE_LIMIT, pool_block=True, max_retries=retries))
+    session.mount(SCRYFALL_IMAGE_BASE_URL, HTTPAdapter(
+        pool_connections=1, pool_maxsize=MAX_WORKERS, pool_block=True, max_retries=retries))
+    # Scryfall asks all clients to send a User-Agent and an Accept header
+    session.headers.update({
+        'User-Agent': 'Scryfall-Downloader/1.0',
+        'Accept': 'application/json;q=0.9,*/*;q=0.8'
+    })
+    return session
+
+# Pillow and the HTTP session are set up by load_dependencies() once a download
+# mode has been chosen, so the menu appears without waiting on those imports.
+# Image stays None if Pillow isn't installed.
+Image = None
+SESSION = None
+
+def load_dependencies():
+    """Imports Pillow and builds the shared session, if that hasn't happened yet."""
+    global Image, SESSION
+    if SESSION is not None:
+        return
+    try:
+        from PIL import Image as pil_image
+        Image = pil_image
+    except ImportError:  # Optional for plain downloads: only borders and meld splitting need it
+        pass
+    SESSION = create_session()
+
+class RateLimiter:
+    """Thread-safe sliding window limiter allowing max_calls requests per period seconds."""
+
+    def __init__(self, max_calls, period):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+
+    def acquire(self):
+        """Blocks until another request may be sent."""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    time.sleep(self._paused_until - now)
+                    continue
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                time.sleep(self.period - (now - self._calls[0]))
+
+    def pause(self, seconds):
+        """Holds back all requests for the given number of seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+API_LIMITER = RateLimiter(API_RATE_LIMIT, API_RATE_PERIOD)
+
+_print_lock = threading.Lock()
+
+def safe_print(message=''):
+    """Prints a line from any thread in a single write, so output from parallel downloads doesn't run together."""
+    with _print_lock:
+        sys.stdout.write(f"{message}\n")
+
+# Where limited_request reports rate limit retries when it isn't passed a log, so a
+# call through the cached fetch_card_json can still send them to its caller's log
+_request_log = contextvars.ContextVar('request_log', default=safe_print)
+
+def get_retry_after(response):
+    """Returns the Retry-After header of a response in seconds, or None if it is missing."""
+    try:
+        return max(float(response.headers.get('Retry-After')), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+def limited_request(method, url, log=None, **kwargs):
+    """Sends a Scryfall API request through the rate limiter, backing off while the API returns 429."""
+    kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+    log = log or _request_log.get()
+    if method == 'GET' and hasattr(SESSION, 'cache'):
+        # Fresh responses in the local cache never reach Scryfall, so they don't use up the
+        # rate limit. requests-cache answers 504 when it has nothing it may serve.
+        response = SESSION.request(method, url, only_if_cached=True, **kwargs)
+        if response.status_code != 504:
+            return response
+    for attempt in range(MAX_RATE_LIMIT_RETRIES):
+        API_LIMITER.acquire()
+        response = SESSION.request(method, url, **kwargs)
+        if response.status_code != 429:
+            return response
+        delay = get_retry_after(response)
+        if delay is None:
+            delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+        log(f"  Rate limited by Scryfall, retrying in {delay:.1f}s...")
+        API_LIMITER.pause(delay)
+    return response
+
+def limited_get(url, **kwargs):
+    """GETs a Scryfall API URL through the rate limiter."""
+    return limited_request('GET', url, **kwargs)
+
+def parse_json(response):
+    """Decodes a JSON API response, using orjson when it is installed."""
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(f"Invalid JSON from {response.url}: {e}", response=response)
+
+@functools.lru_cache(maxsize=4096)
+def fetch_card_json(api_url):
+    """Fetches a card object from the API, remembering it for the rest of the session.
+
+    Raises requests.exceptions.RequestException on failure so errors are not cached.
+    """
+    response = limited_get(api_url)
+    response.raise_for_status()
+    return parse_json(response)
+
+def fetch_card_collection(identifiers, log=safe_print):
+    """Looks up to COLLECTION_BATCH_SIZE cards with a single /cards/collection request.
+
+    Returns a tuple of (found cards, identifiers Scryfall could not match).
+    """
+    response = limited_request(
+        'POST', f"{SCRYFALL_API_BASE_URL}/cards/collection", log=log, json={'identifiers': identifiers})
+    response.raise_for_status()
+    json_data = parse_json(response)
+    return json_data.get('data', []), json_data.get('not_found', [])
+
 def sanitize_filename(name):
     """Removes characters that are invalid for file names."""
     name = name.replace('//', '-')
-    return re.sub(r'[\\/*?:"<>|]', "", name)
+    return name.translate(_FILENAME_TABLE)
 
 def add_border(image, border_size, color_choice):
-    """Adds a border to a given Pillow image object."""
-    if color_choice == 'transparent':
-        color = (0, 0, 0, 0)
-    elif color_choice == 'white':
-        color = (255, 255, 255)
-    else:  # black
-        color = (0, 0, 0)
+    """Adds a border to a given Pillow image object.
 
-    return ImageOps.expand(image, border=border_size, fill=color)
+    With a solid border colour, any transparency in the image (the rounded corners of
+    Scryfall's PNGs) is filled with that colour in the same step, giving an RGB image.
+    """
+    size = (image.width + 2 * border_size, image.height + 2 * border_size)
+    color = BORDER_COLORS.get(color_choice, BORDER_COLORS['black'])
 
-def get_card_data_from_url(card_url):
-    """Extracts set code and card number from a Scryfall web URL and fetches card data."""
-    match = re.search(r'scryfall.com/card/([^/]+)/([^/]+)', card_url)
+    # One pre-filled canvas plus one paste of the card: Pillow does both as
+    # straight fill/copy loops in C, so this is already a single allocation and
+    # a single pass over the pixels with no Python-level per-pixel work
+    if color_choice == 'transparent':
+        # A transparent border needs an alpha channel even when the source image (a JPEG) has none
+        bordered = Image.new('RGBA', size, color)
+        bordered.paste(image, (border_size, border_size))
+    else:
+        # Using the card's own alpha as the paste mask flattens it onto the border colour
+        bordered = Image.new('RGB', size, color[:3])
+        bordered.paste(image, (border_size, border_size), image if image.mode == 'RGBA' else None)
+    return bordered
+
+@contextlib.contextmanager
+def partial_file(file_path):
+    """Yields a temporary path to write to, moved over file_path only once writing succeeds.
+
+    An interrupted run therefore never leaves a truncated image behind that a
+    later run would mistake for a finished download.
+    """
+    temp_path = file_path + PARTIAL_SUFFIX
+    try:
+        yield temp_path
+        os.replace(temp_path, file_path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+
+def save_image(img, file_path, image_format):
+    """Saves an image with encoder settings tuned for print output."""
+    with partial_file(file_path) as temp_path:
+        if image_format == 'jpg':
+            # Pillow's default quality of 75 would visibly degrade the Scryfall source
+            img.save(temp_path, 'JPEG', quality=95, optimize=True, progressive=True, subsampling=0)
+        else:
+            # Files are transient print output, so favour fast zlib over smallest size
+            img.save(temp_path, 'PNG', compress_level=1)
+
+def download_to_file(url, file_path):
+    """Streams an image from Scryfall straight to disk without decoding it."""
+    with SESSION.get(url, headers=IMAGE_HEADERS, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        expected_size = response.headers.get('Content-Length')
+        with partial_file(file_path) as temp_path:
+            with open(temp_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+            # Older urllib3 releases end the stream quietly if the connection drops, so a
+            # short download is caught here rather than being moved into place as a broken image
+            received_size = response.raw.tell()
+            if expected_size is not None and received_size != int(expected_size):
+                raise OSError(f"Download was cut off after {received_size} of {expected_size} bytes")
+
+def open_remote_image(url):
+    """Downloads an image and decodes it straight from the response stream."""
+    with SESSION.get(url, headers=IMAGE_HEADERS, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        img = Image.open(response.raw)
+        img.load()
+    return img
+
+def get_card_data_from_url(card_url, log=print):
+    """Extracts set code, card number and language from a Scryfall web URL and fetches card data."""
+    match = _SCRYFALL_URL.search(card_url)
     if not match:
-        print("  Invalid Scryfall card URL format.")
+        log("  Invalid Scryfall card URL format.")
         return None
-    set_code, collector_number = match.groups()
-    api_url = f"{SCRYFALL_API_BASE_URL}/cards/{set_code}/{collector_number}"
+    api_url = f"{SCRYFALL_API_BASE_URL}/cards/{match['set']}/{match['number']}"
+    if match['lang']:
+        api_url += f"/{match['lang']}"
+    token = _request_log.set(log)
     try:
-        print(f"Fetching card data from: {api_url}")
-        time.sleep(REQUEST_DELAY)
-        response = requests.get(api_url)
-        response.raise_for_status()
-        return response.json()
+        log(f"Fetching card data from: {api_url}")
+        return fetch_card_json(api_url)
     except requests.exceptions.RequestException as e:
-        print(f"  Error fetching card data: {e}")
+        log(f"  Error fetching card data: {e}")
         return None
-
-def process_card(card_data, image_size, download_dir, add_border_flag, border_color):
-    """Processes a single card's JSON data to download its image(s)."""
+    finally:
+        _request_log.reset(token)
+
+def fetch_search_page(search_url, log=safe_print):
+    """Fetches and decodes one page of search results."""
+    response = limited_get(search_url, log=log)
+    response.raise_for_status()
+    return parse_json(response)
+
+def iter_set_pages(set_code, log=print):
+    """Yields each page of cards in a set, following Scryfall's pagination.
+
+    The next page is requested before the current one is yielded, so it is already
+    on its way while the caller works through the current page.
+    Raises requests.exceptions.RequestException if a page can't be fetched.
+    """
+    search_url = f"{SCRYFALL_API_BASE_URL}/cards/search?q=set%3A{set_code}&unique=cards"
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        next_page = prefetcher.submit(fetch_search_page, search_url, log)
+        while next_page:
+            json_data = next_page.result()
+            next_page = None
+            if json_data.get('has_more'):
+                next_page = prefetcher.submit(fetch_search_page, json_data.get('next_page'), log)
+                log("  Found more pages, fetching next...")
+            yield json_data.get('data', [])
+
+# Complete set listings fetched so far, so downloading the same set again after a
+# restart (e.g. in another image size) needs no API requests at all
+_set_cards_cache = {}
+
+def trim_card(card_data):
+    """Returns a copy of a card's JSON with only the CARD_FIELDS it has."""
+    return {key: card_data[key] for key in CARD_FIELDS if key in card_data}
+
+def fetch_set_cards(set_code, log=print):
+    """Fetches every card in a set as one list."""
+    if set_code in _set_cards_cache:
+        log("  Using the card list fetched earlier in this session.")
+        return list(_set_cards_cache[set_code])
+
+    cards = []
+    try:
+        for page in iter_set_pages(set_code, log):
+            cards.extend(trim_card(card) for card in page)
+    except requests.exceptions.RequestException as e:
+        log(f"Error fetching set data: {e}")
+        log("Please check if the set code is correct.")
+        return cards
+
+    _set_cards_cache[set_code] = cards
+    return list(cards)
+
+def fetch_single_card(card_url, log=print):
+    """Fetches the card behind a Scryfall card URL, as a list of zero or one cards."""
+    card_data = get_card_data_from_url(card_url, log)
+    return [card_data] if card_data else []
+
+def identifier_key(identifier):
+    """Returns a hashable key for a /cards/collection identifier."""
+    return tuple(sorted(identifier.items()))
+
+def parse_decklist(deck_lines):
+    """Turns pasted decklist lines into unique /cards/collection identifiers.
+
+    Returns a tuple of (identifiers, deck_names), where deck_names maps each
+    identifier's key to the card name as written in the decklist.
+    """
+    processed_cards = set()
+    identifiers = []
+    deck_names = {}
+    for line in deck_lines:
+        match = _DECK_LINE.match(line)
+        if not match:
+            print(f"Warning: Could not parse line '{line}'. Skipping.")
+            continue
+        _, name, set_code, number = match.groups()
+        name = name.strip()
+        card_identifier = f"{set_code.lower()}-{number}" if set_code and number else name
+        if card_identifier in processed_cards:
+            continue
+        processed_cards.add(card_identifier)
+        identifier = {'set': set_code.lower(), 'collector_number': number} if set_code and number else {'name': name}
+        identifiers.append(identifier)
+        deck_names[identifier_key(identifier)] = name
+    return identifiers, deck_names
+
+def fetch_decklist_cards(identifiers, deck_names, log=print):
+    """Fetches the cards for parsed decklist identifiers in /cards/collection batches.
+
+    The batches are requested together (the rate limiter still spaces them out) and
+    each one is handled as soon as its response arrives.
+    """
+    cards = []
+    batches = [identifiers[start:start + COLLECTION_BATCH_SIZE] for start in range(0, len(identifiers), COLLECTION_BATCH_SIZE)]
+    if not batches:
+        return cards
+
+    with ThreadPoolExecutor(max_workers=min(len(batches), API_RATE_LIMIT)) as executor:
+        futures = [executor.submit(fetch_card_collection, batch, log) for batch in batches]
+        for future in as_completed(futures):
+            try:
+                found, not_found = future.result()
+            except requests.exceptions.RequestException as e:
+                log(f"  Error fetching cards from Scryfall: {e}")
+                continue
+            for card in found:
+                cards.append(card)
+                log(f"  Found: {card.get('name')}")
+            for identifier in not_found:
+                name = deck_names.get(identifier_key(identifier), identifier)
+                log(f"  Error finding '{name}': not found on Scryfall")
+    return cards
+
+def process_card(card_data, image_size, download_dir, add_border_flag, border_color, executor,
+                 existing_files=frozenset(), queued_files=None):
+    """Processes a single card's JSON data, queueing its image download(s) on the executor.
+
+    Images whose file name is in existing_files are already on disk and are not downloaded again.
+    queued_files is the set of file names queued so far in this run; it is shared between
+    calls and added to, so a file that several cards lead to is only downloaded once.
+    Returns the list of futures for the queued downloads.
+    """
+    futures = []
     if not card_data:
-        return
+        return futures
+    if queued_files is None:
+        queued_files = set()
 
     image_format = 'png' if image_size == 'png' or border_color == 'transparent' else 'jpg'
     
@@ -67,144 +509,166 @@ def process_card(card_data, image_size, download_dir, add_border_flag, border_co
     set_code = card_data.get('set', 'unknown')
     collector_number = card_data.get('collector_number', '0')
     flavor_name = sanitize_filename(card_data.get('flavor_name', ''))
+    # The folder is joined on once here; every output path below is built by plain concatenation
+    dir_prefix = os.path.join(download_dir, '')
+    # Shared by every file path built for this card
+    path_prefix = f"{dir_prefix}{set_code}-{collector_number}-"
+    file_ext = f".{image_format}"
+
+    safe_print(f"\nProcessing card: {card_name} ({set_code.upper()} #{collector_number})")
+
+    def already_downloaded(file_path):
+        """Nested helper to check whether an output file was on disk at the start and should be kept."""
+        return os.path.basename(file_path) in existing_files
+
+    def queue_once(file_name, task, *args):
+        """Nested helper to submit a task for file_name, unless an earlier card already queued it.
 
-    print(f"\nProcessing card: {card_name} ({set_code.upper()} #{collector_number})")
+        Meld cards each list every piece of their meld, so the same files come up more than once.
+        """
+        if file_name in queued_files:
+            safe_print(f"  Already queued: {file_name}")
+            return
+        queued_files.add(file_name)
+        futures.append(executor.submit(task, *args))
 
     def download_and_save(url, file_path, is_standard_size):
-        """Nested helper to download, process, and save an image."""
+        """Nested helper to download, process, and save an image. Returns a DOWNLOAD_* status."""
+        if already_downloaded(file_path):
+            safe_print(f"  Skipping existing: {os.path.basename(file_path)}")
+            return DOWNLOAD_SKIPPED
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            img = Image.open(BytesIO(response.content))
+            if not add_border_flag:
+                # Without a border the output format is the one Scryfall serves,
+                # so the file is written as-is instead of being decoded and re-encoded
+                download_to_file(url, file_path)
+            else:
+                img = open_remote_image(url)
 
-            if add_border_flag:
                 if is_standard_size:
-                    pixel_width, _ = img.size
-                    effective_dpi = pixel_width / CARD_WIDTH_INCHES
-                    border_pixels = round(effective_dpi * BORDER_INCHES)
+                    border_pixels = BORDER_PIXELS.get(image_size)
+                    if border_pixels is None or img.width != IMAGE_WIDTHS[image_size]:
+                        effective_dpi = img.width / CARD_WIDTH_INCHES
+                        border_pixels = round(effective_dpi * BORDER_INCHES)
                     img = add_border(img, border_pixels, border_color)
-                    print(f"    Applied {border_pixels}px border based on calculated DPI.")
+                    safe_print(f"    Applied {border_pixels}px border.")
 
-            if image_format == 'jpg' and img.mode == 'RGBA':
-                img = img.convert('RGB')
-            
-            img.save(file_path)
-            print(f"  Successfully downloaded and saved: {os.path.basename(file_path)}")
+                if image_format == 'jpg' and img.mode == 'RGBA':
+                    img = img.convert('RGB')
+
+                save_image(img, file_path, image_format)
+            safe_print(f"  Successfully downloaded and saved: {os.path.basename(file_path)}")
+            return DOWNLOAD_SAVED
         except Exception as e:
-            print(f"  An error occurred processing {card_name}: {e}")
-
-    standard_sizes = ['small', 'normal', 'large', 'png', 'art_crop', 'border_crop']
-    is_standard_size = image_size in standard_sizes
-
-    single_image_layouts = [
-        'normal', 'split', 'flip', 'leveler', 'class', 'case', 'saga',
-        'adventure', 'mutate', 'prototype', 'planar', 'scheme', 'vanguard',
-        'token', 'emblem', 'augment', 'host'
-    ]
-    double_image_layouts = [
-        'transform', 'modal_dfc', 'double_faced_token', 'art_series', 'reversible_card'
-    ]
-
-    if layout in single_image_layouts:
-        if 'image_uris' in card_data and image_size in card_data['image_uris']:
-            image_url = card_data['image_uris'][image_size]
-            base_name = f"{set_code}-{collector_number}-{flavor_name}-{card_name}" if flavor_name else f"{set_code}-{collector_number}-{card_name}"
-            file_name = f"{base_name}.{image_format}"
-            file_path = os.path.join(download_dir, file_name)
-            download_and_save(image_url, file_path, is_standard_size)
-        else:
-            print(f"  Could not find image URI for size '{image_size}' for {card_name}.")
+            safe_print(f"  An error occurred processing {card_name}: {e}")
+            return DOWNLOAD_FAILED
+
+    def split_and_save_meld(image_url, part_name, part_set, part_number):
+        """Nested helper to download a meld result and save its two halves as separate images.
+
+        Returns a DOWNLOAD_* status.
+        """
+        if Image is None:
+            safe_print(f"    Pillow is needed to split the meld result {part_name}. Skipping.")
+            return DOWNLOAD_FAILED
+        file_names = [f"{part_set}-{part_number}-{part_name}-{suffix}" + file_ext for suffix in ('top', 'bottom')]
+        if all(already_downloaded(dir_prefix + file_name) for file_name in file_names):
+            safe_print(f"    Skipping existing: {file_names[0]} and {file_names[1]}")
+            return DOWNLOAD_SKIPPED
+        safe_print(f"    Downloading and splitting meld result: {part_name}")
+        try:
+            img = open_remote_image(image_url)
+
+            width, height = img.size
+            if add_border_flag:
+                # Each half is rotated into a landscape card, so its width is the card's height
+                effective_dpi = (height // 2) / CARD_HEIGHT_INCHES
+                border_pixels = round(effective_dpi * BORDER_INCHES)
+                safe_print(f"    Applying {border_pixels}px border to meld parts.")
+
+            # The halves are finished and saved one at a time so only one set of
+            # intermediate copies is alive at once
+            boxes = [(0, 0, width, height // 2), (0, height // 2, width, height)]
+            for file_name, box in zip(file_names, boxes):
+                half = img.crop(box).transpose(Image.Transpose.ROTATE_90)
+                if add_border_flag:
+                    half = add_border(half, border_pixels, border_color)
+                if image_format == 'jpg' and half.mode == 'RGBA':
+                    half = half.convert('RGB')
+
+                save_image(half, dir_prefix + file_name, image_format)
+                del half
+            safe_print(f"      Saved: {file_names[0]} and {file_names[1]}")
+            return DOWNLOAD_SAVED
+
+        except Exception as e:
+            safe_print(f"    Error processing meld result image for {part_name}: {e}")
+            return DOWNLOAD_FAILED
+
+    is_standard_size = image_size in STANDARD_SIZES
 
-    elif layout in double_image_layouts:
-        if 'card_faces' in card_data:
-            for i, face in enumerate(card_data['card_faces']):
-                if 'image_uris' in face and image_size in face['image_uris']:
+    if layout in SINGLE_IMAGE_LAYOUTS:
+        image_url = card_data.get('image_uris', {}).get(image_size)
+        if image_url:
+            file_path = path_prefix + (f"{flavor_name}-{card_name}" if flavor_name else card_name) + file_ext
+            queue_once(os.path.basename(file_path), download_and_save, image_url, file_path, is_standard_size)
+        else:
+            safe_print(f"  Could not find image URI for size '{image_size}' for {card_name}.")
+
+    elif layout in DOUBLE_IMAGE_LAYOUTS:
+        card_faces = card_data.get('card_faces')
+        if card_faces:
+            for i, face in enumerate(card_faces):
+                image_url = face.get('image_uris', {}).get(image_size)
+                if image_url:
                     face_name = sanitize_filename(face.get('name', f"face{i+1}"))
-                    image_url = face['image_uris'][image_size]
-                    file_name = f"{set_code}-{collector_number}-{face_name}.{image_format}"
-                    file_path = os.path.join(download_dir, file_name)
-                    download_and_save(image_url, file_path, is_standard_size)
+                    file_path = path_prefix + face_name + file_ext
+                    queue_once(os.path.basename(file_path), download_and_save, image_url, file_path, is_standard_size)
                 else:
-                    print(f"  Could not find image URI for size '{image_size}' for face {i+1} of {card_name}.")
+                    safe_print(f"  Could not find image URI for size '{image_size}' for face {i+1} of {card_name}.")
         else:
-            print(f"  Layout is '{layout}' but no 'card_faces' data found for {card_name}.")
+            safe_print(f"  Layout is '{layout}' but no 'card_faces' data found for {card_name}.")
 
     elif layout == 'meld':
-        if 'all_parts' in card_data:
-            print(f"  Processing meld card. It has {len(card_data['all_parts'])} parts.")
-            for part in card_data['all_parts']:
+        all_parts = card_data.get('all_parts')
+        if all_parts:
+            safe_print(f"  Processing meld card. It has {len(all_parts)} parts.")
+            for part in all_parts:
                 component_type = part.get('component')
                 part_name = sanitize_filename(part.get('name', 'UnknownPart'))
-                if component_type in ['meld_part', 'meld_result']:
+                if component_type in MELD_COMPONENTS:
                     part_data = None
                     try:
                         api_uri = part['uri']
-                        time.sleep(REQUEST_DELAY)
-                        response = requests.get(api_uri)
-                        response.raise_for_status()
-                        part_data = response.json()
+                        part_data = fetch_card_json(api_uri)
                     except requests.exceptions.RequestException as e:
-                        print(f"    Error fetching meld part data for {part_name}: {e}")
+                        safe_print(f"    Error fetching meld part data for {part_name}: {e}")
                         continue
 
                     if not part_data:
-                        print(f"    Could not get data for meld part: {part_name}")
+                        safe_print(f"    Could not get data for meld part: {part_name}")
                         continue
 
                     part_set = part_data.get('set', 'unknown')
                     part_number = part_data.get('collector_number', '0')
 
-                    if 'image_uris' in part_data and image_size in part_data['image_uris']:
-                        image_url = part_data['image_uris'][image_size]
-
+                    image_url = part_data.get('image_uris', {}).get(image_size)
+                    if image_url:
                         if component_type == 'meld_result':
-                            print(f"    Downloading and splitting meld result: {part_name}")
-                            try:
-                                response = requests.get(image_url)
-                                response.raise_for_status()
-                                img = Image.open(BytesIO(response.content))
-                                
-                                width, height = img.size
-                                top_half = img.crop((0, 0, width, height // 2))
-                                bottom_half = img.crop((0, height // 2, width, height))
-
-                                top_half = top_half.transpose(Image.Transpose.ROTATE_90)
-                                bottom_half = bottom_half.transpose(Image.Transpose.ROTATE_90)
-                                
-                                if add_border_flag:
-                                    pixel_width, _ = top_half.size
-                                    effective_dpi = pixel_width / CARD_HEIGHT_INCHES
-                                    border_pixels = round(effective_dpi * BORDER_INCHES)
-                                    print(f"    Applying {border_pixels}px border to meld parts.")
-                                    
-                                    top_half = add_border(top_half, border_pixels, border_color)
-                                    bottom_half = add_border(bottom_half, border_pixels, border_color)
-                                
-                                if image_format == 'jpg':
-                                    if top_half.mode == 'RGBA':
-                                        top_half = top_half.convert('RGB')
-                                    if bottom_half.mode == 'RGBA':
-                                        bottom_half = bottom_half.convert('RGB')
-
-                                top_filename = f"{part_set}-{part_number}-{part_name}-top.{image_format}"
-                                bottom_filename = f"{part_set}-{part_number}-{part_name}-bottom.{image_format}"
-
-                                top_half.save(os.path.join(download_dir, top_filename))
-                                bottom_half.save(os.path.join(download_dir, bottom_filename))
-                                print(f"      Saved: {top_filename} and {bottom_filename}")
-
-                            except Exception as e:
-                                print(f"    Error processing meld result image for {part_name}: {e}")
+                            # The two halves are always saved together, so the top one stands in for both
+                            file_name = f"{part_set}-{part_number}-{part_name}-top" + file_ext
+                            queue_once(file_name, split_and_save_meld, image_url, part_name, part_set, part_number)
                         else:
-                            file_name = f"{part_set}-{part_number}-{part_name}.{image_format}"
-                            file_path = os.path.join(download_dir, file_name)
-                            download_and_save(image_url, file_path, True)
+                            file_name = f"{part_set}-{part_number}-{part_name}" + file_ext
+                            queue_once(file_name, download_and_save, image_url, dir_prefix + file_name, True)
                     else:
-                        print(f"    Could not find image URI for size '{image_size}' for meld part: {part_name}")
+                        safe_print(f"    Could not find image URI for size '{image_size}' for meld part: {part_name}")
         else:
-            print(f"  Layout is 'meld' but no 'all_parts' data found for {card_name}.")
+            safe_print(f"  Layout is 'meld' but no 'all_parts' data found for {card_name}.")
     else:
-        print(f"  Unhandled card layout: '{layout}' for card {card_name}. Skipping.")
+        safe_print(f"  Unhandled card layout: '{layout}' for card {card_name}. Skipping.")
+
+    return futures
 
 def main():
     """Main function to run the script."""
@@ -212,10 +676,7 @@ def main():
     print(" Scryfall Magic: The Gathering Downloader")
     print("=========================================")
 
-    if getattr(sys, 'frozen', False):
-        script_dir = os.path.dirname(sys.executable)
-    else:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
+    script_dir = get_script_dir()
 
     download_mode = ''
     print("\nSelect download mode:")
@@ -229,6 +690,46 @@ def main():
             break
         print("Invalid choice. Please enter 1, 2, or 3.")
 
+    load_dependencies()
+
+    # The card data is fetched in the background while the remaining questions are
+    # answered; its messages are held back so they don't interrupt the prompts.
+    fetch_log = []
+    fetch_executor = ThreadPoolExecutor(max_workers=1)
+    folder_name = ""
+
+    if download_mode == '1':
+        set_code = input("\nEnter the set letter tag (e.g., BRO, DSK): ").strip().lower()
+        folder_name = set_code
+        print(f"\nFetching card list for set: {set_code.upper()}...")
+        cards_future = fetch_executor.submit(fetch_set_cards, set_code, fetch_log.append)
+
+    elif download_mode == '2':
+        # The URL is checked here rather than in the background fetch, so a typo is
+        # caught straight away instead of after the remaining questions
+        while True:
+            card_url = input("\nPaste the full Scryfall card URL: ").strip()
+            if _SCRYFALL_URL.search(card_url):
+                break
+            print("Invalid Scryfall card URL format. It should look like https://scryfall.com/card/<set>/<number>/<name>")
+        folder_name = "singles"
+        cards_future = fetch_executor.submit(fetch_single_card, card_url, fetch_log.append)
+
+    elif download_mode == '3':
+        folder_name = sanitize_filename(input("\nEnter a name for the deck folder: ").strip())
+        if not folder_name:
+            folder_name = "pasted-deck"
+        print("\nPaste your decklist below (view README for format). Enter a blank line to finish.")
+        deck_lines = []
+        while True:
+            line = input()
+            if not line:
+                break
+            deck_lines.append(line)
+        print(f"\nParsing decklist and fetching from Scryfall...")
+        identifiers, deck_names = parse_decklist(deck_lines)
+        cards_future = fetch_executor.submit(fetch_decklist_cards, identifiers, deck_names, fetch_log.append)
+
     image_sizes = ['small', 'normal', 'large', 'png', 'art_crop', 'border_crop']
     print("\nAvailable image sizes:")
     for i, size in enumerate(image_sizes):
@@ -249,18 +750,21 @@ def main():
 
     add_border_flag = False
     border_color = ''
-    print("\nAdd a 1/8 inch border for print bleed?")
-    print("[1] Yes")
-    print("[2] No")
-    while True:
-        choice = input("Enter your choice (1 or 2): ").strip()
-        if choice == '1':
-            add_border_flag = True
-            break
-        elif choice == '2':
-            add_border_flag = False
-            break
-        print("Invalid choice. Please enter 1 or 2.")
+    if Image is None:
+        print("\nPillow is not installed, so images will be downloaded without a border.")
+    else:
+        print("\nAdd a 1/8 inch border for print bleed?")
+        print("[1] Yes")
+        print("[2] No")
+        while True:
+            choice = input("Enter your choice (1 or 2): ").strip()
+            if choice == '1':
+                add_border_flag = True
+                break
+            elif choice == '2':
+                add_border_flag = False
+                break
+            print("Invalid choice. Please enter 1 or 2.")
 
     if add_border_flag:
         print("\nEnter border color:")
@@ -275,80 +779,27 @@ def main():
                 break
             else:
                 print("Invalid choice. Please enter 1, 2, or 3.")
-        print(f"A 1/8 inch ({border_color}) border will be added. Pixel size is calculated per-image.")
-
-    cards_to_process = []
-    folder_name = ""
-
-    if download_mode == '1':
-        set_code = input("\nEnter the set letter tag (e.g., BRO, DSK): ").strip().lower()
-        folder_name = set_code
-        search_url = f"{SCRYFALL_API_BASE_URL}/cards/search?q=set%3A{set_code}&unique=cards"
-        print(f"\nFetching card list for set: {set_code.upper()}...")
-        while search_url:
-            try:
-                time.sleep(REQUEST_DELAY)
-                response = requests.get(search_url)
-                response.raise_for_status()
-                json_data = response.json()
-                cards_to_process.extend(json_data.get('data', []))
-                if json_data.get('has_more'):
-                    search_url = json_data.get('next_page')
-                    print("  Found more pages, fetching next...")
-                else:
-                    search_url = None
-            except requests.exceptions.RequestException as e:
-                print(f"Error fetching set data: {e}")
-                print("Please check if the set code is correct.")
-                search_url = None
+        if image_size_choice in BORDER_PIXELS:
+            print(f"A 1/8 inch ({border_color}) border of {BORDER_PIXELS[image_size_choice]}px will be added.")
+        else:
+            print(f"A 1/8 inch ({border_color}) border will be added. Pixel size is calculated per-image.")
+        if border_color == 'transparent' and image_size_choice != 'png':
+            print("JPEG has no transparency, so these images will be saved as PNG files instead.")
 
-    elif download_mode == '2':
-        card_url = input("\nPaste the full Scryfall card URL: ").strip()
-        folder_name = "singles"
-        card_data = get_card_data_from_url(card_url)
-        if card_data:
-            cards_to_process.append(card_data)
+    if not cards_future.done():
+        print("\nWaiting for Scryfall to finish sending card data...")
+    cards_to_process = cards_future.result()
+    fetch_executor.shutdown()
+    for message in fetch_log:
+        print(message)
 
-    elif download_mode == '3':
-        folder_name = sanitize_filename(input("\nEnter a name for the deck folder: ").strip())
-        if not folder_name:
-            folder_name = "pasted-deck"
-        print("\nPaste your decklist below (view README for format). Enter a blank line to finish.")
-        deck_lines = []
-        while True:
-            line = input()
-            if not line:
-                break
-            deck_lines.append(line)
-        line_regex = re.compile(r"^\s*(\d+)\s+(.+?)(?:\s+\((\w{3,5})\)\s+([\w\d-]+))?\s*$")
-        processed_cards = set()
-        print(f"\nParsing decklist and fetching from Scryfall...")
-        for line in deck_lines:
-            match = line_regex.match(line)
-            if not match:
-                print(f"Warning: Could not parse line '{line}'. Skipping.")
-                continue
-            _, name, set_code, number = match.groups()
-            name = name.strip()
-            card_identifier = f"{set_code.lower()}-{number}" if set_code and number else name
-            if card_identifier in processed_cards:
-                continue
-            api_url = f"{SCRYFALL_API_BASE_URL}/cards/{set_code.lower()}/{number}" if set_code and number else f"{SCRYFALL_API_BASE_URL}/cards/named?exact={quote_plus(name)}"
-            try:
-                time.sleep(REQUEST_DELAY)
-                response = requests.get(api_url)
-                response.raise_for_status()
-                cards_to_process.append(response.json())
-                processed_cards.add(card_identifier)
-                print(f"  Found: {name}")
-            except requests.exceptions.RequestException as e:
-                print(f"  Error finding '{name}': {e}")
-    
     if not cards_to_process:
         print("\nNo cards to download. Exiting.")
         return
 
     print("\nA file dialog will now open. Please select where to save the output folder.")
+    import tkinter
+    from tkinter import filedialog
     root = tkinter.Tk()
     root.attributes('-topmost', True) # Force the dialog to the front
     root.withdraw()  # Hide the root window
@@ -365,15 +816,50 @@ def main():
 
     download_dir = os.path.join(base_dir, folder_name)
 
-    if not os.path.exists(download_dir):
-        print(f"\nCreating directory: {download_dir}")
+    existing_files = set()
+    try:
         os.makedirs(download_dir)
+        print(f"\nCreated directory: {download_dir}")
+    except FileExistsError:
+        # One directory listing up front, instead of checking every output file separately
+        with os.scandir(download_dir) as entries:
+            entries = list(entries)
+        if entries:
+            print("\nThis folder already contains files. What should happen to cards that are already downloaded?")
+            print("[1] Skip them")
+            print("[2] Download them again and overwrite")
+            while True:
+                choice = input("Enter your choice (1 or 2): ").strip()
+                if choice in ['1', '2']:
+                    if choice == '1':
+                        # An empty file is not a finished download, so it is fetched again
+                        existing_files = {entry.name for entry in entries if entry.is_file() and entry.stat().st_size > 0}
+                    break
+                print("Invalid choice. Please enter 1 or 2.")
 
     print(f"\nStarting download of {len(cards_to_process)} card(s) as '{image_size_choice}' images...")
     
-    for card in cards_to_process:
-        process_card(card, image_size_choice, download_dir, add_border_flag, border_color)
-        time.sleep(REQUEST_DELAY)
+    # Bordering and saving run on these same threads rather than on a process pool:
+    # Pillow releases the GIL while it decodes, pastes and encodes, and worker
+    # processes would need every image pickled across to them and break the frozen exe.
+    # Each output file is queued once, so no two threads ever write the same file
+    queued_files = set()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = []
+        try:
+            for card in cards_to_process:
+                futures.extend(process_card(card, image_size_choice, download_dir, add_border_flag, border_color, executor, existing_files, queued_files))
+            # Tally results as they finish rather than in submission order
+            results = Counter(future.result() for future in as_completed(futures))
+        except BaseException:
+            # Leaving the with block waits for every queued download, so on Ctrl+C the
+            # ones that haven't started yet are cancelled first. Files being written
+            # are cleaned up by partial_file.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    print(f"\nFinished {len(futures)} download(s): {results[DOWNLOAD_SAVED]} saved, "
+          f"{results[DOWNLOAD_SKIPPED]} already downloaded, {results[DOWNLOAD_FAILED]} failed.")
 
     print("\n=========================================")
     print("Download process finished!")